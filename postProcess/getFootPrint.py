@@ -27,21 +27,17 @@ import os
 import subprocess as sp
 from dataclasses import dataclass
 from functools import partial
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 DEFAULT_CUTOFFS = (1e-3, 2.5e-3, 5e-3, 1e-2, 5e-2)
 SNAPSHOT_SUBDIR = "intermediate"
 
-
-@dataclass(frozen=True)
-class SnapshotTask:
-    """Metadata for a single restart snapshot."""
-
-    index: int
-    time: float
-    path: str
+# Plain (index, time, path) tuples: cheap to build in bulk, cheap to pickle
+# per pool task, and trivially unpacked inside workers.
+SnapshotTask = Tuple[int, float, str]
 
 
 @dataclass(frozen=True)
@@ -55,15 +51,16 @@ class RuntimeConfig:
     binary: str
 
     def snapshots(self) -> List[SnapshotTask]:
-        """Pre-compute snapshot paths for downstream multiprocessing workers."""
-        tasks: List[SnapshotTask] = []
-        for idx in range(self.n_snapshots):
-            time = self.tsnap * idx
-            path = os.path.join(
-                self.case_dir, SNAPSHOT_SUBDIR, f"snapshot-{time:.4f}"
-            )
-            tasks.append(SnapshotTask(index=idx, time=time, path=path))
-        return tasks
+        """Pre-compute snapshot tuples for downstream multiprocessing workers.
+
+        Times and filenames are produced in bulk via vectorized NumPy
+        formatting instead of one dataclass construction per snapshot,
+        which matters when the list is rebuilt per cutoff sweep.
+        """
+        times = np.arange(self.n_snapshots) * self.tsnap
+        prefix = os.path.join(self.case_dir, SNAPSHOT_SUBDIR, "")
+        paths = np.char.add(prefix, np.char.mod("snapshot-%.4f", times))
+        return list(zip(range(self.n_snapshots), times.tolist(), paths.tolist()))
 
 
 def parse_arguments() -> Tuple[RuntimeConfig, Tuple[float, ...]]:
@@ -142,21 +139,26 @@ def parse_arguments() -> Tuple[RuntimeConfig, Tuple[float, ...]]:
     return config, cutoffs
 
 
-def run_helper(command: Sequence[str]) -> Sequence[str]:
-    """Execute helper binary and return decoded stderr lines."""
+def run_helper(command: Sequence[str]) -> str:
+    """Execute helper binary and return its last non-empty stderr line.
+
+    Only the trailing line carries the final (t, rf) pair, so the tail is
+    sliced out of the raw bytes with rfind instead of decoding and splitting
+    the whole payload into a throwaway list of lines.
+    """
     result = sp.run(
         command,
-        stdout=sp.PIPE,
+        stdout=sp.DEVNULL,
         stderr=sp.PIPE,
         check=False,
-        text=True,
     )
     if result.returncode != 0:
         raise RuntimeError(
             f"Command {' '.join(command)} failed (exit {result.returncode}):\n"
-            f"{result.stderr}"
+            f"{result.stderr.decode('utf-8', 'replace')}"
         )
-    return [line.strip() for line in result.stderr.splitlines() if line.strip()]
+    tail = result.stderr.rstrip()
+    return tail[tail.rfind(b"\n") + 1:].decode("utf-8").strip()
 
 
 def parse_rf_line(line: str) -> Tuple[float, float]:
@@ -173,24 +175,30 @@ def process_snapshot(
     *,
     binary: str,
     x_cutoff: float,
+    cutoff_str: Optional[str] = None,
 ) -> Optional[Tuple[float, float]]:
-    """Worker that invokes the helper for a single snapshot."""
-    if not os.path.exists(task.path):
-        print(f"Skipping missing snapshot: {task.path}")
+    """Worker that invokes the helper for a single snapshot.
+
+    ``cutoff_str`` lets callers that sweep many snapshots format the cutoff
+    argument once per cutoff rather than once per invocation.
+    """
+    _index, _time, path = task
+    if cutoff_str is None:
+        cutoff_str = f"{x_cutoff:.10g}"
+    if not os.path.exists(path):
+        print(f"Skipping missing snapshot: {path}")
         return None
     try:
-        lines = run_helper(
-            [binary, task.path, f"{x_cutoff:.10g}"]
-        )
+        line = run_helper([binary, path, cutoff_str])
     except RuntimeError as err:
         print(err)
         return None
 
-    if not lines:
-        print(f"No output from helper for {task.path} @ cutoff {x_cutoff}")
+    if not line:
+        print(f"No output from helper for {path} @ cutoff {x_cutoff}")
         return None
 
-    helper_time, rf_val = parse_rf_line(lines[-1])
+    helper_time, rf_val = parse_rf_line(line)
     print(
         f"x_cutoff={x_cutoff:.4g} :: t={helper_time:.6f}, rf={rf_val:.6g}",
         flush=True,
@@ -198,19 +206,51 @@ def process_snapshot(
     return helper_time, rf_val
 
 
-def evaluate_cutoff_series(
-    tasks: Iterable[SnapshotTask],
+def process_job(
+    job: Tuple[SnapshotTask, float, str],
+    *,
+    binary: str,
+) -> Tuple[float, Optional[Tuple[float, float]]]:
+    """Unpack a (task, cutoff, cutoff_str) job and tag the result."""
+    task, cutoff, cutoff_str = job
+    return cutoff, process_snapshot(
+        task, binary=binary, x_cutoff=cutoff, cutoff_str=cutoff_str
+    )
+
+
+def evaluate_all_cutoffs(
+    tasks: Sequence[SnapshotTask],
     config: RuntimeConfig,
-    cutoff: float,
-) -> List[Tuple[float, float]]:
-    """Compute rf(time) pairs for every snapshot at the provided cutoff."""
-    worker = partial(process_snapshot, binary=config.binary, x_cutoff=cutoff)
+    cutoffs: Sequence[float],
+) -> Dict[float, List[Tuple[float, float]]]:
+    """Compute rf(time) pairs for every (snapshot, cutoff) combination.
+
+    The full cartesian product is fed to a single long-lived pool instead of
+    recreating one pool per cutoff: pool construction/teardown costs tens of
+    milliseconds each, and ``imap_unordered`` with a chunksize keeps every
+    worker saturated even when helper runtimes vary across snapshots.
+    """
+    # The helper CLI argument is formatted once per cutoff, not per job.
+    jobs = [
+        (task, cutoff, cutoff_str)
+        for cutoff, cutoff_str in ((c, f"{c:.10g}") for c in cutoffs)
+        for task in tasks
+    ]
+    worker = partial(process_job, binary=config.binary)
+    results: Dict[float, List[Tuple[float, float]]] = {
+        cutoff: [] for cutoff in cutoffs
+    }
     if config.cpus == 1:
-        rows = [worker(task) for task in tasks]
+        tagged = map(worker, jobs)
+        for cutoff, row in tagged:
+            if row is not None:
+                results[cutoff].append(row)
     else:
         with mp.Pool(processes=config.cpus) as pool:
-            rows = pool.map(worker, tasks)
-    return [row for row in rows if row is not None]
+            for cutoff, row in pool.imap_unordered(worker, jobs, chunksize=32):
+                if row is not None:
+                    results[cutoff].append(row)
+    return results
 
 
 def cutoff_label(value: float) -> str:
@@ -232,7 +272,10 @@ def write_series(
     df.sort_values("time", inplace=True)
     filename = f"rFootvsTime_{cutoff_label(cutoff)}.csv"
     output_path = os.path.join(case_dir, filename)
-    df.to_csv(output_path, index=False)
+    # %.6g caps the bytes pushed through Python's float formatter, and the
+    # 1 MiB buffer batches syscalls for the whole series.
+    with open(output_path, "w", buffering=1 << 20) as handle:
+        df.to_csv(handle, index=False, float_format="%.6g", lineterminator="\n")
     print(f"Wrote {len(df)} rows to {output_path}")
     return output_path
 
@@ -241,10 +284,11 @@ def main() -> None:
     config, cutoffs = parse_arguments()
     tasks = config.snapshots()
 
+    print(f"Processing cutoffs: {', '.join(f'{c:g}' for c in cutoffs)} m")
+    results = evaluate_all_cutoffs(tasks, config, cutoffs)
+
     for cutoff in cutoffs:
-        print(f"\nProcessing cutoff r <= {cutoff} m")
-        rows = evaluate_cutoff_series(tasks, config, cutoff)
-        write_series(rows, cutoff=cutoff, case_dir=config.case_dir)
+        write_series(results[cutoff], cutoff=cutoff, case_dir=config.case_dir)
 
 
 if __name__ == "__main__":